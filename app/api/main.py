@@ -6,14 +6,32 @@ system. It integrates the retriever and LLM chain components to provide a REST A
 for querying employee information.
 """
 
+import asyncio
 import logging
+from bisect import bisect_right
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from app.core.config import settings
-from app.core.schemas import ChatRequest, ChatResponse, SearchRequest, SearchResponse
-from app.services.llm_service import get_qa_chain
-from app.services.data_service import load_employee_docs
+from pydantic import TypeAdapter
+from app.core.schemas import (
+    BatchChatRequest,
+    BatchChatResponse,
+    ChatRequest,
+    ChatResponse,
+    Employee,
+    SearchRequest,
+    SearchResponse,
+)
+from app.services.llm_service import build_chain, get_llm, get_qa_chain
+from app.services.data_service import (
+    filter_employees_kernel,
+    get_employee_arrays,
+    load_employee_docs,
+)
 from app.core.prompts import prompt_hr_queries
 
 # Configure logging
@@ -24,7 +42,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Employee Search RAG API",
     description="API for searching employee information using RAG",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -39,8 +58,69 @@ app.add_middleware(
 # Load employee data at startup
 employees = load_employee_docs()
 
-# Initialize QA chain
+# Build the columnar (SoA) arrays once at startup so filtering runs in the
+# compiled kernel instead of per-row Python
+employee_arrays = get_employee_arrays()
+
+# Validates whole employee lists in one C-level pass instead of a Python loop
+employee_list_adapter = TypeAdapter(List[Employee])
+
+def build_name_corpus(names_lower: Tuple[str, ...]) -> Tuple[str, List[int]]:
+    """
+    Concatenate lowercased names into a single searchable corpus.
+
+    A substring query then runs as one C-level scan over the corpus instead
+    of a Python loop over rows, with start offsets mapping matches back to
+    employee positions.
+
+    Args:
+        names_lower (Tuple[str, ...]): Lowercased employee names.
+
+    Returns:
+        Tuple[str, List[int]]: The corpus string and per-name start offsets.
+    """
+    offsets: List[int] = []
+    position = 0
+    for name in names_lower:
+        offsets.append(position)
+        position += len(name) + 1
+    return "\n".join(names_lower), offsets
+
+name_corpus, name_offsets = build_name_corpus(employee_arrays.names_lower)
+
+def find_name_matches(query: str) -> Set[int]:
+    """
+    Find positions of all employees whose name contains the query.
+
+    Args:
+        query (str): Case-insensitive name fragment.
+
+    Returns:
+        Set[int]: Matching employee positions.
+    """
+    query = query.lower()
+    if not query or "\n" in query:
+        return set()
+
+    matches: Set[int] = set()
+    start = name_corpus.find(query)
+    while start != -1:
+        matches.add(bisect_right(name_offsets, start) - 1)
+        start = name_corpus.find(query, start + 1)
+    return matches
+
+# Initialize QA chain, plus a raw chain for token streaming
 qa_chain = get_qa_chain(prompt=prompt_hr_queries)
+streaming_chain = build_chain(prompt=prompt_hr_queries)
+
+@app.on_event("startup")
+async def preload_llm():
+    """Force the quantized model into memory so the first /chat has no cold start."""
+    try:
+        get_llm().invoke(" ")
+        logger.info(f"Preloaded LLM model: {settings.LLM_MODEL}")
+    except Exception as e:
+        logger.warning(f"Could not preload LLM model: {str(e)}")
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
@@ -60,13 +140,71 @@ async def chat(request: ChatRequest):
         if not request.query:
             raise HTTPException(status_code=400, detail="Query is empty")
             
-        response = qa_chain.invoke(request.query)
+        response = await qa_chain.ainvoke(request.query)
         return ChatResponse(response=response)
-        
+
     except Exception as e:
         logger.error(f"Error processing chat request: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint emitting tokens as Server-Sent Events.
+
+    Args:
+        request (ChatRequest): The chat request containing the query.
+
+    Returns:
+        StreamingResponse: text/event-stream of generated tokens, terminated
+        by a [DONE] event.
+
+    Raises:
+        HTTPException: If the query is empty.
+    """
+    if not request.query:
+        raise HTTPException(status_code=400, detail="Query is empty")
+
+    async def event_generator():
+        try:
+            async for token in streaming_chain.astream(request.query):
+                yield f"data: {orjson.dumps({'chunk': token}).decode()}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming chat response: {str(e)}")
+            yield f"data: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+@app.post("/chat/batch", response_model=BatchChatResponse)
+async def chat_batch(request: BatchChatRequest):
+    """
+    Batch chat endpoint that processes multiple queries concurrently.
+
+    Args:
+        request (BatchChatRequest): The batch request containing the queries.
+
+    Returns:
+        BatchChatResponse: Responses in the same order as the queries.
+
+    Raises:
+        HTTPException: If there's an error processing the queries.
+    """
+    try:
+        if not request.queries:
+            raise HTTPException(status_code=400, detail="No queries provided")
+
+        responses = await asyncio.gather(
+            *[qa_chain.ainvoke(query) for query in request.queries]
+        )
+        return BatchChatResponse(responses=responses)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing batch chat request: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 from fastapi import Query
 
 @app.get("/employees/search", response_model=SearchResponse)
@@ -92,37 +230,40 @@ async def search_employees(
         HTTPException: If there's an error processing the search.
     """
     try:
-        filtered_employees = employees.copy()
-
-        # Filter by name
-        if name:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if name.lower() in emp["name"].lower()
-            ]
-
-        # Filter by skills (comma-separated)
+        # Pack the requested skills into the same bit layout as the SoA store;
+        # a skill nobody has means no employee can match
+        required_skill_mask = np.zeros(employee_arrays.skill_bits.shape[1], dtype=np.uint64)
         if skills:
-            skill_list = [s.strip().lower() for s in skills.split(",")]
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if all(skill in [s.lower() for s in emp["skills"]] for skill in skill_list)
-            ]
+            for skill in (s.strip().lower() for s in skills.split(",")):
+                bit = employee_arrays.skill_to_bit.get(skill)
+                if bit is None:
+                    return SearchResponse(total=0, employees=[])
+                required_skill_mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
 
+        availability_code = -1
+        if availability:
+            availability_code = employee_arrays.availability_to_code.get(availability.lower(), -2)
+            if availability_code == -2:
+                return SearchResponse(total=0, employees=[])
 
-        # Filter by experience
-        if min_experience is not None:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if emp["experience_years"] >= min_experience
-            ]
+        # Experience, availability and skill filters run in one compiled pass
+        mask = filter_employees_kernel(
+            employee_arrays.experience_years,
+            employee_arrays.availability_codes,
+            employee_arrays.skill_bits,
+            min_experience if min_experience is not None else 0,
+            availability_code,
+            required_skill_mask
+        )
+        candidate_ids = set(np.flatnonzero(mask).tolist())
 
-        # Filter by availability
-        if availability:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if emp["availability"].lower() == availability.lower()
-            ]
+        # Filter by name with a single scan over the concatenated name corpus
+        if name:
+            candidate_ids &= find_name_matches(name)
+
+        filtered_employees = employee_list_adapter.validate_python(
+            [employees[idx] for idx in sorted(candidate_ids)]
+        )
 
         return SearchResponse(
             total=len(filtered_employees),
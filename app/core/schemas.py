@@ -2,12 +2,14 @@
 Data models and schemas for the Employee Search RAG application.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 
 class Employee(BaseModel):
     """Employee information model."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: int = Field(..., description="Unique employee identifier")
     name: str = Field(..., description="Employee's full name")
     skills: List[str] = Field(..., description="List of employee's skills")
@@ -25,6 +27,15 @@ class ChatResponse(BaseModel):
     response: str = Field(..., description="The response from the RAG system")
     timestamp: datetime = Field(default_factory=datetime.now)
 
+class BatchChatRequest(BaseModel):
+    """Batch chat request model."""
+    queries: List[str] = Field(..., description="Queries to process concurrently")
+
+class BatchChatResponse(BaseModel):
+    """Batch chat response model."""
+    responses: List[str] = Field(..., description="Responses in the same order as the queries")
+    timestamp: datetime = Field(default_factory=datetime.now)
+
 class SearchRequest(BaseModel):
     """Search request model."""
     name: Optional[str] = Field(None, description="Search by employee name")
@@ -4,19 +4,39 @@ Data service module for the Employee Search RAG application.
 This module handles data loading, validation, and management functionality.
 """
 
-import json
+import functools
 import os
 import logging
-from typing import List, Dict, Any
-from langchain_core.documents import Document
+from concurrent.futures import ProcessPoolExecutor
+import orjson
+import numpy as np
+from numba import njit
+from typing import Any, Dict, List, NamedTuple, Tuple
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+def get_data_path(file_path: str = settings.DATA_PATH) -> str:
+    """
+    Resolve the absolute path to a data file relative to the project root.
+
+    Args:
+        file_path (str): Path relative to the project root.
+
+    Returns:
+        str: Absolute path to the file.
+    """
+    current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(current_dir, file_path)
+
+@functools.lru_cache(maxsize=4)
 def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, Any]]:
     """
     Load employee data from a JSON file.
 
+    The result is cached per file path so repeated callers (API startup,
+    retriever build) share one parsed copy instead of re-reading the file.
+
     Args:
         file_path (str): Path to the JSON file containing employee data.
 
@@ -25,22 +45,19 @@ def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, An
 
     Raises:
         FileNotFoundError: If the specified file doesn't exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
+        orjson.JSONDecodeError: If the file contains invalid JSON.
         ValueError: If the file doesn't contain any employee data.
         Exception: For other unexpected errors during loading.
     """
     try:
-        # Get the absolute path to the file
-        current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        full_path = os.path.join(current_dir, file_path)
-        
+        full_path = get_data_path(file_path)
         logger.info(f"Loading employee data from: {full_path}")
         
         if not os.path.exists(full_path):
             raise FileNotFoundError(f"Employee data file not found at: {full_path}")
             
-        with open(full_path, "r") as f:
-            data = json.load(f)["employees"]
+        with open(full_path, "rb") as f:
+            data = orjson.loads(f.read())["employees"]
             
         if not data:
             raise ValueError("No employee data found in the file")
@@ -48,7 +65,7 @@ def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, An
         logger.info(f"Successfully loaded {len(data)} employee records")
         return data
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Error parsing JSON file: {str(e)}")
         raise
     except Exception as e:
@@ -66,65 +83,132 @@ def format_employee(emp: Dict[str, Any]) -> str:
     Returns:
         str: Formatted employee document.
     """
-    return f"""Employee Profile:
-        ID: {emp['id']}
-        Name: {emp['name']}
-        Skills: {', '.join(emp['skills'])}
-        Experience: {emp['experience_years']} years
-        Projects: {', '.join(emp['projects'])}
-        Availability: {emp['availability']}
-
-        Key Details:
-        - Primary Skills: {', '.join(emp['skills'][:3])}
-        - Years of Experience: {emp['experience_years']}
-        - Current Availability: {emp['availability']}
-        - Project Experience: {', '.join(emp['projects'])}
+    skills_list = emp['skills']
+    skills = ', '.join(skills_list)
+    primary_skills = skills if len(skills_list) <= 3 else ', '.join(skills_list[:3])
+    projects = ', '.join(emp['projects'])
+    experience = emp['experience_years']
+    availability = emp['availability']
+    return "\n".join((
+        "Employee Profile:",
+        f"ID: {emp['id']}",
+        f"Name: {emp['name']}",
+        f"Skills: {skills}",
+        f"Experience: {experience} years",
+        f"Projects: {projects}",
+        f"Availability: {availability}",
+        "",
+        "Key Details:",
+        f"- Primary Skills: {primary_skills}",
+        f"- Years of Experience: {experience}",
+        f"- Current Availability: {availability}",
+        f"- Project Experience: {projects}",
+    ))
+
+class EmployeeArrays(NamedTuple):
+    """Structure-of-arrays view over the employee list for vectorized filtering."""
+    ids: np.ndarray
+    experience_years: np.ndarray
+    availability_codes: np.ndarray
+    availability_to_code: Dict[str, int]
+    names_lower: Tuple[str, ...]
+    skills_sets: Tuple[frozenset, ...]
+    skill_bits: np.ndarray
+    skill_to_bit: Dict[str, int]
+
+@functools.lru_cache(maxsize=1)
+def get_employee_arrays() -> EmployeeArrays:
     """
+    Build a columnar (SoA) view over the employees for fast filtering.
 
-def create_skill_document(emp: Dict[str, Any], skill: str) -> Document:
-    """
-    Create a skill-specific document for an employee.
-
-    Args:
-        emp (Dict[str, Any]): Employee information dictionary.
-        skill (str): Specific skill to create document for.
+    Numeric fields become numpy arrays so range and equality filters run as
+    single vectorized comparisons, and availability strings are mapped to
+    small integer codes.
 
     Returns:
-        Document: LangChain Document object.
+        EmployeeArrays: Columnar arrays over the loaded employees.
     """
-    return Document(
-        page_content=f"""Employee {emp['name']} has expertise in {skill} with {emp['experience_years']} years of experience.
-Projects involving {skill}: {', '.join(emp['projects'])}
-Availability: {emp['availability']}""",
-        metadata={
-            "id": emp["id"],
-            "name": emp["name"],
-            "skill": skill,
-            "experience": emp["experience_years"],
-            "type": "skill_specific"
-        }
+    employees = load_employee_docs()
+    availability_to_code: Dict[str, int] = {}
+    codes = []
+    skill_to_bit: Dict[str, int] = {}
+    # Lowercase each skill list exactly once; the frozensets are the
+    # canonical per-employee skill sets for membership tests
+    skills_sets = tuple(
+        frozenset(skill.lower() for skill in emp["skills"]) for emp in employees
+    )
+    for emp, skill_set in zip(employees, skills_sets):
+        status = emp["availability"].lower()
+        codes.append(availability_to_code.setdefault(status, len(availability_to_code)))
+        for skill in skill_set:
+            skill_to_bit.setdefault(skill, len(skill_to_bit))
+
+    # Bit-pack each employee's skill set into uint64 words so a skill
+    # subset test is one AND/compare per 64 distinct skills
+    words = max(1, (len(skill_to_bit) + 63) // 64)
+    skill_bits = np.zeros((len(employees), words), dtype=np.uint64)
+    for idx, skill_set in enumerate(skills_sets):
+        for skill in skill_set:
+            bit = skill_to_bit[skill]
+            skill_bits[idx, bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+
+    return EmployeeArrays(
+        ids=np.asarray([emp["id"] for emp in employees], dtype=np.int32),
+        experience_years=np.asarray([emp["experience_years"] for emp in employees], dtype=np.int16),
+        availability_codes=np.asarray(codes, dtype=np.int8),
+        availability_to_code=availability_to_code,
+        names_lower=tuple(emp["name"].lower() for emp in employees),
+        skills_sets=skills_sets,
+        skill_bits=skill_bits,
+        skill_to_bit=skill_to_bit
     )
 
-def create_project_document(emp: Dict[str, Any], project: str) -> Document:
+@njit(cache=True)
+def filter_employees_kernel(experience_years, availability_codes, skill_bits,
+                            min_experience, availability_code, required_skill_mask):
     """
-    Create a project-specific document for an employee.
+    Compiled filter over the SoA arrays returning a boolean keep-mask.
 
-    Args:
-        emp (Dict[str, Any]): Employee information dictionary.
-        project (str): Specific project to create document for.
+    Skill membership is a bitwise AND/compare per uint64 word, so an
+    employee's whole skill set is tested in one instruction per 64 skills.
+    An availability_code below zero disables the availability filter.
+    """
+    count = experience_years.shape[0]
+    mask = np.zeros(count, dtype=np.bool_)
+    for i in range(count):
+        if experience_years[i] < min_experience:
+            continue
+        if availability_code >= 0 and availability_codes[i] != availability_code:
+            continue
+        keep = True
+        for word in range(required_skill_mask.shape[0]):
+            required = required_skill_mask[word]
+            if (skill_bits[i, word] & required) != required:
+                keep = False
+                break
+        if keep:
+            mask[i] = True
+    return mask
+
+@functools.lru_cache(maxsize=1)
+def get_formatted_employees() -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """
+    Load employees and pair each with its formatted profile document.
+
+    The tuple is built once and memoized so index rebuilds don't redo the
+    string formatting for every employee.
+
+    Formatting is embarrassingly parallel across employees, so large
+    datasets fan out over a process pool; small ones stay serial since
+    worker startup would cost more than the formatting itself.
 
     Returns:
-        Document: LangChain Document object.
+        Tuple[Tuple[str, Dict[str, Any]], ...]: (formatted profile, employee) pairs.
     """
-    return Document(
-        page_content=f"""Employee {emp['name']} worked on {project} project.
-Skills used: {', '.join(emp['skills'])}
-Experience: {emp['experience_years']} years
-Availability: {emp['availability']}""",
-        metadata={
-            "id": emp["id"],
-            "name": emp["name"],
-            "project": project,
-            "type": "project_specific"
-        }
-    )
\ No newline at end of file
+    employees = load_employee_docs()
+    if len(employees) >= 5000:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            formatted = executor.map(format_employee, employees, chunksize=256)
+            return tuple(zip(formatted, employees))
+    return tuple((format_employee(emp), emp) for emp in employees)
+
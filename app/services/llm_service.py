@@ -6,20 +6,90 @@ prompt management, and response generation.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import faiss
+import numpy as np
 from langchain_community.llms import Ollama
 from langchain.chains import RetrievalQA
 from langchain.prompts import PromptTemplate
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain.chains import create_retrieval_chain
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from app.core.config import settings
-from app.services.retriever_service import get_retriever
+from app.services.retriever_service import embed_query, get_retriever
 
 logger = logging.getLogger(__name__)
 
+# Shared pooled session so Ollama health checks reuse connections instead
+# of opening a fresh TCP socket per call
+_session = requests.Session()
+_session.mount(
+    "http://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=40, max_retries=Retry(total=3, backoff_factor=0.1))
+)
+
+
+class SemanticCache:
+    """
+    Semantic cache for LLM responses keyed by query embedding.
+
+    Exact repeats are served from an in-memory dict; near-duplicate queries
+    are matched by cosine similarity over L2-normalized query embeddings in
+    a FAISS inner-product index.
+    """
+
+    def __init__(self, threshold: float = settings.SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.exact_hits: Dict[str, str] = {}
+        self.responses: List[str] = []
+        self.index: Optional[faiss.IndexFlatIP] = None
+
+    def _embed(self, query: str) -> np.ndarray:
+        vec = np.asarray([embed_query(query)], dtype=np.float32)
+        faiss.normalize_L2(vec)
+        return vec
+
+    def get(self, query: str) -> Optional[str]:
+        """
+        Look up a cached response for the query.
+
+        Args:
+            query (str): The incoming query.
+
+        Returns:
+            Optional[str]: Cached response if a hit is found, None otherwise.
+        """
+        if query in self.exact_hits:
+            logger.info("Semantic cache: exact hit")
+            return self.exact_hits[query]
+
+        if self.index is None or self.index.ntotal == 0:
+            return None
+
+        scores, indices = self.index.search(self._embed(query), 1)
+        if scores[0][0] >= self.threshold:
+            logger.info(f"Semantic cache: similarity hit (score={scores[0][0]:.3f})")
+            return self.responses[indices[0][0]]
+        return None
+
+    def add(self, query: str, response: str) -> None:
+        """
+        Store a query/response pair in the cache.
+
+        Args:
+            query (str): The query that produced the response.
+            response (str): The generated response to cache.
+        """
+        self.exact_hits[query] = response
+        vec = self._embed(query)
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(vec.shape[1])
+        self.index.add(vec)
+        self.responses.append(response)
+
 def check_ollama_connection() -> bool:
     """
     Check if the Ollama service is running and accessible.
@@ -28,7 +98,7 @@ def check_ollama_connection() -> bool:
         bool: True if Ollama is running and accessible, False otherwise.
     """
     try:
-        response = requests.get(f"{settings.OLLAMA_BASE_URL}/api/tags")
+        response = _session.get(f"{settings.OLLAMA_BASE_URL}/api/tags", timeout=5)
         return response.status_code == 200
     except requests.exceptions.ConnectionError:
         return False
@@ -46,7 +116,7 @@ def get_llm() -> Ollama:
     if not check_ollama_connection():
         raise ConnectionError(
             f"Cannot connect to Ollama at {settings.OLLAMA_BASE_URL}. "
-            "Make sure it's running with 'ollama run mistral:7b'"
+            f"Make sure it's running with 'ollama run {settings.LLM_MODEL}'"
         )
     
     return Ollama(
@@ -56,6 +126,31 @@ def get_llm() -> Ollama:
         stop=["Human:", "Assistant:"]
     )
 
+def build_chain(prompt: PromptTemplate) -> Any:
+    """
+    Build the raw retrieval + generation chain.
+
+    Args:
+        prompt (PromptTemplate): Prompt template for the document chain.
+
+    Returns:
+        Any: Configured chain supporting invoke/ainvoke/astream.
+    """
+    logger.info("Initializing LLM")
+    llm = get_llm()
+
+    logger.info("Building vector store")
+    retriever = get_retriever()
+
+    # Create document chain
+    document_chain = create_stuff_documents_chain(llm, prompt)
+
+    # Create the final chain with proper input handling
+    return (
+        {"context": retriever, "question": RunnablePassthrough()}
+        | document_chain
+    )
+
 def get_qa_chain(prompt: PromptTemplate) -> Any:
     """
     Build and return a Question-Answering chain.
@@ -67,23 +162,29 @@ def get_qa_chain(prompt: PromptTemplate) -> Any:
         Exception: If there's an error building the chain.
     """
     try:
-        logger.info("Initializing LLM")
-        llm = get_llm()
-        
-        logger.info("Building vector store")
-        retriever = get_retriever()
+        chain = build_chain(prompt)
 
-        
-        # Create document chain
-        document_chain = create_stuff_documents_chain(llm, prompt)
-        
-        # Create the final chain with proper input handling
-        chain = (
-            {"context": retriever, "question": RunnablePassthrough()}
-            | document_chain
-        )
-        
-        return chain
+        # Wrap the chain with a semantic cache so near-duplicate queries
+        # skip retrieval and generation entirely
+        cache = SemanticCache()
+
+        def invoke_with_cache(question: str) -> str:
+            cached = cache.get(question)
+            if cached is not None:
+                return cached
+            response = chain.invoke(question)
+            cache.add(question, response)
+            return response
+
+        async def ainvoke_with_cache(question: str) -> str:
+            cached = cache.get(question)
+            if cached is not None:
+                return cached
+            response = await chain.ainvoke(question)
+            cache.add(question, response)
+            return response
+
+        return RunnableLambda(invoke_with_cache, afunc=ainvoke_with_cache)
         
     except Exception as e:
         logger.error(f"Error building QA chain: {str(e)}")
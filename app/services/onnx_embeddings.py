@@ -0,0 +1,97 @@
+"""
+ONNX Runtime embedding backend for the Employee Search RAG application.
+
+This module provides an int8-quantized ONNX Runtime alternative to the
+eager PyTorch sentence-transformers backend for embedding generation.
+"""
+
+import logging
+import os
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ONNXEmbeddings(Embeddings):
+    """
+    Sentence embeddings computed through an int8-quantized ONNX Runtime session.
+
+    On first use the configured model is exported to ONNX and dynamically
+    quantized to int8 under the embedding cache directory; subsequent runs
+    load the quantized model directly. Encoding tokenizes in batches,
+    mean-pools the last hidden state with the attention mask, and
+    L2-normalizes the vectors.
+    """
+
+    def __init__(self, model_name: str = settings.EMBEDDING_MODEL, batch_size: int = 32):
+        self.batch_size = batch_size
+        quantized_dir = os.path.join(
+            settings.EMBEDDING_CACHE_PATH, "onnx", model_name.replace("/", "_")
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        if not os.path.exists(quantized_dir):
+            logger.info(f"Exporting {model_name} to int8 ONNX at: {quantized_dir}")
+            model = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True, provider="CPUExecutionProvider"
+            )
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=quantized_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+            )
+
+        logger.info(f"Loading quantized ONNX embedding model from: {quantized_dir}")
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            quantized_dir, provider="CPUExecutionProvider"
+        )
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        pooled_batches = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            tokens = self.tokenizer(
+                batch, padding=True, truncation=True, return_tensors="pt"
+            )
+            hidden = self.model(**tokens).last_hidden_state.cpu().numpy()
+            mask = tokens["attention_mask"].numpy()[:, :, None].astype(np.float32)
+            pooled_batches.append(
+                (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            )
+
+        vectors = np.concatenate(pooled_batches, axis=0)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of documents.
+
+        Args:
+            texts (List[str]): Documents to embed.
+
+        Returns:
+            List[List[float]]: L2-normalized embedding per document.
+        """
+        return self._encode(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a single query.
+
+        Args:
+            text (str): Query to embed.
+
+        Returns:
+            List[float]: L2-normalized query embedding.
+        """
+        return self._encode([text])[0].tolist()
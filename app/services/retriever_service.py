@@ -5,38 +5,245 @@ This module handles all vector store and retrieval-related functionality includi
 document formatting, embedding generation, and similarity search.
 """
 
+import functools
+import hashlib
 import logging
+import math
+import os
 from typing import List, Dict, Any
+import faiss
+import numpy as np
+import torch
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from app.services.data_service import load_employee_docs, format_employee, create_skill_document, create_project_document
+import orjson
+from app.services.data_service import get_formatted_employees, load_employee_docs
 from app.core.config import settings
-from app.services.data_service import load_employee_docs
 
 logger = logging.getLogger(__name__)
 
+# Configure CPU threading before any model is instantiated: torch defaults
+# to a single intra-op thread in many deployment environments, and
+# sentence-transformers reads the env vars at import/initialization time
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 4))
+os.environ.setdefault("MKL_NUM_THREADS", str(os.cpu_count() or 4))
+torch.set_num_threads(int(os.getenv("TORCH_THREADS", os.cpu_count() or 4)))
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Interop thread count can only be set once per process
+    pass
+logger.info(f"torch intra-op threads set to {torch.get_num_threads()}")
 
 
+@functools.lru_cache(maxsize=1)
+def get_embeddings() -> Any:
+    """
+    Build and return the embedding model used across the application.
+
+    Memoized so the retriever builder and the semantic cache share one
+    instance instead of loading the model weights twice. The backend is
+    selected by settings.EMBEDDING_BACKEND.
+
+    Returns:
+        Any: Configured embedding model instance.
+    """
+    if settings.EMBEDDING_BACKEND == "onnx":
+        # Imported lazily so the optimum/onnxruntime stack is only needed
+        # when the backend is actually selected
+        from app.services.onnx_embeddings import ONNXEmbeddings
+        logger.info(f"Loading ONNX embedding model: {settings.EMBEDDING_MODEL}")
+        return ONNXEmbeddings()
+
+    if torch.cuda.is_available():
+        device = "cuda"
+    elif torch.backends.mps.is_available():
+        device = "mps"
+    else:
+        device = "cpu"
+    logger.info(f"Loading embedding model {settings.EMBEDDING_MODEL} on {device}")
+    embeddings = HuggingFaceEmbeddings(
+        model_name=settings.EMBEDDING_MODEL,
+        model_kwargs={'device': device},
+        encode_kwargs={'normalize_embeddings': True, 'batch_size': 64}
+    )
+
+    # Optionally run the encoder in half precision; vectors are converted
+    # back to float32 before they reach FAISS, which stores FP32 anyway
+    if settings.EMBEDDING_DTYPE == "float16" and device == "cuda":
+        embeddings.client.half()
+    elif settings.EMBEDDING_DTYPE == "bfloat16":
+        embeddings.client.to(torch.bfloat16)
+
+    return embeddings
+
+
+def build_index(vectors: np.ndarray) -> faiss.Index:
+    """
+    Build the FAISS index configured by settings.INDEX_TYPE.
+
+    Args:
+        vectors (np.ndarray): Document embeddings, shape (n, dimension), float32.
+
+    Returns:
+        faiss.Index: Populated FAISS index.
+    """
+    dimension = vectors.shape[1]
+
+    if settings.INDEX_TYPE == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, settings.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = settings.HNSW_EF_CONSTRUCTION
+        index.add(vectors)
+        # Search breadth only needs to comfortably cover k results
+        index.hnsw.efSearch = min(settings.MAX_RESULTS * 4, settings.HNSW_EF_SEARCH)
+    elif settings.INDEX_TYPE == "sq8":
+        # int8 scalar quantization: 4x smaller index and roughly 2x faster
+        # distance loops since retrieval is memory-bound at this dimensionality
+        index = faiss.IndexScalarQuantizer(
+            dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add(vectors)
+    elif settings.INDEX_TYPE == "ivfsq8":
+        # Inverted lists over int8-quantized vectors: only nprobe of the
+        # ~sqrt(n) cells are scanned per query, on top of the 4x compression
+        nlist = max(4, int(math.sqrt(vectors.shape[0])))
+        index = faiss.IndexIVFScalarQuantizer(
+            faiss.IndexFlatIP(dimension), dimension, nlist,
+            faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add(vectors)
+        index.nprobe = min(8, nlist)
+    else:
+        index = faiss.IndexFlatIP(dimension)
+        index.add(vectors)
+
+    logger.info(f"Built {settings.INDEX_TYPE} index with {index.ntotal} vectors")
+    return index
+
+
+@functools.lru_cache(maxsize=1024)
+def _embed_query_cached(query: str) -> tuple:
+    return tuple(get_embeddings().embed_query(query))
+
+
+def embed_query(query: str) -> List[float]:
+    """
+    Embed a query, serving repeated strings from an LRU cache.
+
+    Streamlit reruns and filter tweaks commonly resubmit identical
+    queries; cache hits skip the encoder forward pass entirely.
+
+    Args:
+        query (str): Query text.
+
+    Returns:
+        List[float]: Normalized query embedding.
+    """
+    return list(_embed_query_cached(query))
+
+
+class ThresholdRetriever(BaseRetriever):
+    """
+    Retriever that fetches top-2k by similarity and applies the score
+    threshold in a single pass.
+
+    LangChain's similarity_score_threshold mode over-fetches and filters
+    document-by-document in Python; fetching a fixed candidate count and
+    cutting on score once is cheaper and also keeps the scores available.
+    """
+
+    db: Any
+    k: int
+    threshold: float
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        pairs = self.db.similarity_search_with_score_by_vector(
+            embed_query(query), k=self.k * 2
+        )
+        return [doc for doc, score in pairs if score >= self.threshold][:self.k]
+
+
+def maybe_to_gpu(index: faiss.Index) -> faiss.Index:
+    """
+    Move the index to GPU when configured and faiss-gpu is installed.
+
+    Args:
+        index (faiss.Index): CPU-resident index.
+
+    Returns:
+        faiss.Index: GPU-resident index, or the input when not applicable.
+    """
+    if settings.FAISS_USE_GPU and hasattr(faiss, "index_cpu_to_all_gpus"):
+        logger.info("Moving FAISS index to GPU")
+        return faiss.index_cpu_to_all_gpus(index)
+    return index
+
+
+@functools.lru_cache(maxsize=1)
 def get_retriever() -> Any:
     """
     Build and return a configured retriever.
 
+    Memoized so repeated callers (QA chain, streaming chain) share one
+    retriever instead of reloading the index per call.
+
     Returns:
         Any: Configured retriever instance.
     """
     try:
-        employees = load_employee_docs()
-        logger.info(f"Loaded {len(employees)} employees from data source.")
-        
-        # Create documents with enhanced metadata
+        embeddings = get_embeddings()
+
+        # Load a previously persisted index when the employee content and
+        # embedding model are unchanged, skipping the re-embedding of every
+        # document. Hashing the content (not the file mtime) keeps the cache
+        # valid across checkouts and touch-only changes.
+        content_hash = hashlib.sha256(
+            orjson.dumps(load_employee_docs(), option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        manifest = {"hash": content_hash, "model": settings.EMBEDDING_MODEL}
+        manifest_path = os.path.join(settings.VECTOR_STORE_PATH, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "rb") as f:
+                stored_manifest = orjson.loads(f.read())
+            if stored_manifest == manifest:
+                logger.info(f"Loading persisted FAISS index from: {settings.VECTOR_STORE_PATH}")
+                db = FAISS.load_local(
+                    settings.VECTOR_STORE_PATH, embeddings,
+                    allow_dangerous_deserialization=True,
+                    distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+                )
+                db.index = maybe_to_gpu(db.index)
+                return ThresholdRetriever(
+                    db=db,
+                    k=settings.MAX_RESULTS,
+                    threshold=settings.SIMILARITY_THRESHOLD
+                )
+
+        formatted_employees = get_formatted_employees()
+        logger.info(f"Loaded {len(formatted_employees)} employees from data source.")
+
+        # Create documents with enhanced metadata; "idx" points back into
+        # the raw employee list so consumers can fetch the source dict
+        # without any serialization round-trip
         docs = []
-        for emp in employees:
+        for idx, (formatted, emp) in enumerate(formatted_employees):
             # Create main document
             main_doc = Document(
-                page_content=format_employee(emp),
+                page_content=formatted,
                 metadata={
+                    "idx": idx,
                     "id": emp["id"],
                     "name": emp["name"],
                     "availability": emp["availability"],
@@ -47,34 +254,56 @@ def get_retriever() -> Any:
                 }
             )
             docs.append(main_doc)
-            
-            # Create skill-specific documents
-            for skill in emp["skills"]:
-                docs.append(create_skill_document(emp, skill))
-                
-            # Create project-specific documents
-            for project in emp["projects"]:
-                docs.append(create_project_document(emp, project))
-        
-        # Initialize embeddings
-        embeddings = HuggingFaceEmbeddings(
-            model_name=settings.EMBEDDING_MODEL,
-            model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
+
+
+        # Embed all documents in a single batched call instead of letting
+        # the vector store drive one embedding request per document. The
+        # byte store persists per-document vectors so a rebuild only embeds
+        # documents whose content actually changed.
+        texts = [doc.page_content for doc in docs]
+        metadatas = [doc.metadata for doc in docs]
+        cached_embeddings = CacheBackedEmbeddings.from_bytes_store(
+            embeddings,
+            LocalFileStore(settings.EMBEDDING_CACHE_PATH),
+            namespace=settings.EMBEDDING_MODEL
+        )
+        # Sort by length before encoding so each batch pads to similar
+        # lengths, then restore the original order afterwards
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        logger.info(f"Embedding {len(texts)} documents in length-sorted batches")
+        sorted_vectors = cached_embeddings.embed_documents([texts[i] for i in order])
+        vectors: List[List[float]] = [[] for _ in texts]
+        for position, i in enumerate(order):
+            vectors[i] = sorted_vectors[position]
+
+        # Collapse the list-of-lists into one contiguous float32 buffer and
+        # normalize in place (guarding zero rows) so inner-product scores are
+        # cosine similarities and the FAISS add is a straight memcpy
+        vectors_np = np.ascontiguousarray(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors_np, axis=1, keepdims=True)
+        np.divide(vectors_np, norms, out=vectors_np, where=norms > 0)
+        index = build_index(vectors_np)
+
+        # Wrap the index in the LangChain vector store
+        db = FAISS(
+            embedding_function=embeddings,
+            index=index,
+            docstore=InMemoryDocstore({str(i): doc for i, doc in enumerate(docs)}),
+            index_to_docstore_id={i: str(i) for i in range(len(docs))},
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+            relevance_score_fn=lambda score: score
         )
-        
-        # Create vector store
-        db = FAISS.from_documents(docs, embeddings)
         db.save_local(settings.VECTOR_STORE_PATH)
+        with open(manifest_path, "wb") as f:
+            f.write(orjson.dumps(manifest))
+        # Persist first (write_index needs a CPU index), then optionally move
+        db.index = maybe_to_gpu(db.index)
         
         # Return retriever with hybrid search
-        return db.as_retriever(
-            search_type="similarity_score_threshold",
-            search_kwargs={
-                "k": settings.MAX_RESULTS,
-                "score_threshold": settings.SIMILARITY_THRESHOLD,
-                "filter": None
-            }
+        return ThresholdRetriever(
+            db=db,
+            k=settings.MAX_RESULTS,
+            threshold=settings.SIMILARITY_THRESHOLD
         )
         
     except Exception as e:
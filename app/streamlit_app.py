@@ -5,11 +5,10 @@ This module provides a user-friendly web interface for interacting with the
 employee search system, including both chat and structured search capabilities.
 """
 
+import json
 import streamlit as st
 import requests
-import json
 from typing import List, Optional
-import pandas as pd
 
 from core.config import settings
 
@@ -21,6 +20,58 @@ def initialize_session_state():
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
 
+def get_http_session() -> requests.Session:
+    """
+    Return the shared keep-alive HTTP session for API calls.
+
+    Stored in st.session_state so Streamlit reruns reuse the same pooled
+    connections instead of opening a new TCP socket per interaction.
+    """
+    if "http_session" not in st.session_state:
+        session = requests.Session()
+        session.headers.update({"Connection": "keep-alive"})
+        session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        )
+        st.session_state.http_session = session
+    return st.session_state.http_session
+
+def stream_chat_tokens(response: requests.Response):
+    """
+    Yield chat tokens from a text/event-stream response.
+
+    Args:
+        response (requests.Response): Streaming response from /chat/stream.
+
+    Yields:
+        str: Generated tokens as they arrive.
+    """
+    for line in response.iter_lines():
+        if not line.startswith(b"data: "):
+            continue
+        payload = line[len(b"data: "):]
+        if payload == b"[DONE]":
+            break
+        event = json.loads(payload)
+        if "error" in event:
+            raise RuntimeError(event["error"])
+        yield event["chunk"]
+
+@st.cache_data(ttl=300, max_entries=256)
+def cached_search(params_tuple: tuple) -> dict:
+    """
+    Call the search endpoint, memoizing responses per canonicalized params.
+
+    Args:
+        params_tuple (tuple): Sorted (key, value) pairs of query parameters.
+    """
+    response = get_http_session().get(
+        f"{API_BASE_URL}/employees/search", params=dict(params_tuple)
+    )
+    response.raise_for_status()
+    return response.json()
+
 def display_chat_message(message: str, is_user: bool = True):
     """Display a chat message in the chat interface."""
     with st.chat_message("user" if is_user else "assistant"):
@@ -41,18 +92,17 @@ def chat_interface():
         st.session_state.chat_history.append({"content": prompt, "is_user": True})
         
         try:
-            # Call API
-            response = requests.post(
-                f"{API_BASE_URL}/chat",
-                json={"query": prompt}
-            )
-            response.raise_for_status()
-            
-            # Display assistant response
-            assistant_response = response.json()["response"]
-            display_chat_message(assistant_response, False)
+            # Stream tokens into the chat bubble as the server generates them
+            with get_http_session().post(
+                f"{API_BASE_URL}/chat/stream",
+                json={"query": prompt},
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                with st.chat_message("assistant"):
+                    assistant_response = st.write_stream(stream_chat_tokens(response))
             st.session_state.chat_history.append({"content": assistant_response, "is_user": False})
-            
+
         except Exception as e:
             st.error(f"Error: {str(e)}")
 
@@ -87,19 +137,19 @@ def search_interface():
             if availability:
                 params["availability"] = availability
             
-            # Call API
-            response = requests.get(
-                f"{API_BASE_URL}/employees/search",
-                params=params
-            )
-            response.raise_for_status()
-            
-            # Display results
-            results = response.json()
+            # Call API (memoized per parameter combination)
+            results = cached_search(tuple(sorted(params.items())))
             if results["total"] > 0:
-                # Convert to DataFrame for better display
-                df = pd.DataFrame(results["employees"])
-                st.dataframe(df)
+                # Imported lazily: pandas is only needed on this branch and
+                # costs ~100 ms of cold-start on every rerun otherwise
+                import pandas as pd
+
+                # Transpose to dict-of-lists first: the columnar DataFrame
+                # constructor skips pandas' per-row type inference
+                employees = results["employees"]
+                columns = list(employees[0].keys())
+                columnar = {col: [emp.get(col) for emp in employees] for col in columns}
+                st.dataframe(pd.DataFrame(columnar, copy=False))
             else:
                 st.info("No employees found matching your criteria.")
                 
@@ -115,9 +165,14 @@ def main():
     )
     
     st.title("HR Assistant")
-    
+
     # Initialize session state
     initialize_session_state()
+
+    # Allow users to drop memoized API responses after data changes
+    with st.sidebar:
+        if st.button("🔄 Refresh"):
+            st.cache_data.clear()
     
     # Create tabs for different interfaces
     tab1, tab2 = st.tabs(["Chat", "Search"])